@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Question Bank Index
+- Inverted index over questions parsed from HTML forms
+- Normalized Bengali and English tokens of question text and options
+- Incremental updates as HTML files change
+- Similar question lookup, duplicate clustering and option-list reuse
+"""
+
+import os
+import re
+import gzip
+import hashlib
+import json
+import argparse
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Set
+
+from ultimate_html_to_google_form_converter import UltimateHTMLFormParser
+
+DEFAULT_INDEX_FILE = 'question_bank.json.gz'
+
+_BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+_LEADING_NUMBER = re.compile(r'^\s*[0-9০-৯]+\s*[.)।]\s*')
+_TOKEN = re.compile(r'[0-9a-z\u0980-\u09ff]+')
+_ZERO_WIDTH = re.compile(r'[\u200b-\u200d\ufeff]')
+
+def normalize_text(text: str) -> str:
+    """Normalize question or option text for matching"""
+    text = unicodedata.normalize('NFC', text or '')
+    text = _ZERO_WIDTH.sub('', text)
+    text = _LEADING_NUMBER.sub('', text)
+    return text.translate(_BENGALI_DIGITS).lower()
+
+def tokenize(text: str) -> List[str]:
+    """Split normalized Bengali/English text into tokens"""
+    return _TOKEN.findall(normalize_text(text))
+
+def option_list_key(options: List[str]) -> str:
+    """Short key identifying an option list by its normalized options"""
+    normalized = '\x1f'.join(normalize_text(option).strip() for option in options)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+def _encode_postings(postings: Dict[str, Set[int]]) -> Dict[str, List[int]]:
+    """Delta-encode sorted id lists for storage"""
+    encoded = {}
+    for token, ids in postings.items():
+        deltas = []
+        previous = 0
+        for doc_id in sorted(ids):
+            deltas.append(doc_id - previous)
+            previous = doc_id
+        encoded[token] = deltas
+    return encoded
+
+def _decode_postings(encoded: Dict[str, List[int]]) -> Dict[str, Set[int]]:
+    postings = {}
+    for token, deltas in encoded.items():
+        ids = set()
+        current = 0
+        for delta in deltas:
+            current += delta
+            ids.add(current)
+        postings[token] = ids
+    return postings
+
+class QuestionBank:
+    """Inverted index of questions from UltimateHTMLFormParser output
+
+    Question text and options are indexed separately: similarity and
+    duplicates are scored on question text only, so a question carrying a
+    long shared option list (e.g. all districts) is not drowned out by its
+    options. Option lists are matched by token search and grouped by their
+    exact normalized contents to find reuse.
+    """
+
+    VERSION = 3
+
+    # Fields of a document record
+    SOURCE, NUMBER, TEXT, TYPE, OPTIONS, HAS_OTHER, TEXT_TOKENS, OPTION_KEY = range(8)
+
+    def __init__(self, index_file: str = DEFAULT_INDEX_FILE):
+        self.index_file = index_file
+        self.files = {}            # path -> {'mtime': int, 'size': int, 'docs': [doc ids]}
+        self.docs = {}             # doc id -> [source, number, text, type, options, has_other,
+                                   #            text token count, option list key]
+        self.postings = {}         # question text token -> set of doc ids
+        self.option_postings = {}  # option token -> set of doc ids
+        self.option_lists = {}     # option list key -> set of doc ids
+        self.next_id = 0
+
+    # Storage
+
+    def load(self) -> 'QuestionBank':
+        """Load the index from disk if it exists"""
+        if not os.path.exists(self.index_file):
+            return self
+
+        with gzip.open(self.index_file, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != self.VERSION:
+            return self
+
+        self.files = data['files']
+        self.docs = {int(doc_id): doc for doc_id, doc in data['docs'].items()}
+        self.next_id = data['next_id']
+
+        # Postings are stored as delta-encoded sorted id lists
+        self.postings = _decode_postings(data['postings'])
+        self.option_postings = _decode_postings(data['option_postings'])
+
+        self.option_lists = {}
+        for doc_id, doc in self.docs.items():
+            if doc[self.OPTION_KEY]:
+                self.option_lists.setdefault(doc[self.OPTION_KEY], set()).add(doc_id)
+        return self
+
+    def save(self):
+        """Write the index to disk"""
+        data = {
+            'version': self.VERSION,
+            'next_id': self.next_id,
+            'files': self.files,
+            'docs': {str(doc_id): doc for doc_id, doc in self.docs.items()},
+            'postings': _encode_postings(self.postings),
+            'option_postings': _encode_postings(self.option_postings)
+        }
+
+        tmp_file = self.index_file + '.tmp'
+        with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, self.index_file)
+
+    # Indexing
+
+    def _option_tokens(self, options: List[str]) -> Set[str]:
+        tokens = set()
+        for option in options:
+            tokens.update(tokenize(option))
+        return tokens
+
+    def _add_doc(self, source: str, question: Dict[str, Any]) -> int:
+        doc_id = self.next_id
+        self.next_id += 1
+
+        options = question.get('options', [])
+        text_tokens = set(tokenize(question.get('question_text', '')))
+        option_key = option_list_key(options) if options else None
+
+        # Text token count is stored so scoring never re-tokenizes after load()
+        self.docs[doc_id] = [
+            source,
+            question.get('question_number', 999),
+            question.get('question_text', ''),
+            question.get('type', ''),
+            options,
+            bool(question.get('has_other')),
+            len(text_tokens),
+            option_key
+        ]
+        for token in text_tokens:
+            self.postings.setdefault(token, set()).add(doc_id)
+        for token in self._option_tokens(options):
+            self.option_postings.setdefault(token, set()).add(doc_id)
+        if option_key:
+            self.option_lists.setdefault(option_key, set()).add(doc_id)
+        return doc_id
+
+    def _discard(self, index: Dict[str, Set[int]], keys: Iterable[str], doc_id: int):
+        for key in keys:
+            ids = index.get(key)
+            if ids:
+                ids.discard(doc_id)
+                if not ids:
+                    del index[key]
+
+    def _remove_file(self, path: str):
+        entry = self.files.pop(path, None)
+        if not entry:
+            return
+        for doc_id in entry['docs']:
+            doc = self.docs.pop(doc_id)
+            self._discard(self.postings, set(tokenize(doc[self.TEXT])), doc_id)
+            self._discard(self.option_postings, self._option_tokens(doc[self.OPTIONS]), doc_id)
+            if doc[self.OPTION_KEY]:
+                self._discard(self.option_lists, [doc[self.OPTION_KEY]], doc_id)
+
+    def update(self, html_files: Iterable[Path], prune: bool = True) -> Dict[str, Any]:
+        """Re-index new or changed files, skipping unchanged ones
+
+        With ``prune`` set, files that were indexed before but are not in
+        ``html_files`` any more are dropped from the index.
+        """
+        parser = UltimateHTMLFormParser()
+        summary = {'added': [], 'updated': [], 'removed': [], 'unchanged': 0, 'errors': []}
+        seen = set()
+
+        for html_file in html_files:
+            # Resolved so the same files match whatever directory or spelling is used
+            path = str(Path(html_file).resolve())
+            seen.add(path)
+            stat = os.stat(path)
+            entry = self.files.get(path)
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                summary['unchanged'] += 1
+                continue
+
+            try:
+                form_data = parser.parse_html_file(path)
+            except Exception as e:
+                summary['errors'].append({'file': path, 'error': str(e)})
+                continue
+
+            self._remove_file(path)
+            doc_ids = [self._add_doc(path, question) for question in form_data['questions']]
+            self.files[path] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'docs': doc_ids}
+            summary['updated' if entry else 'added'].append(path)
+
+        if prune:
+            for path in [p for p in self.files if p not in seen]:
+                self._remove_file(path)
+                summary['removed'].append(path)
+
+        return summary
+
+    # Queries
+
+    def _doc_result(self, doc_id: int, score: float) -> Dict[str, Any]:
+        source, number, text, q_type, options, has_other, _, option_key = self.docs[doc_id]
+        return {
+            'id': doc_id,
+            'score': round(score, 4),
+            'source': source,
+            'question_number': number,
+            'question_text': text,
+            'type': q_type,
+            'options': options,
+            'has_other': has_other,
+            'option_list': option_key
+        }
+
+    def _overlaps(self, tokens: Set[str], postings: Dict[str, Set[int]]) -> Dict[int, int]:
+        """Count shared tokens per document using the postings"""
+        overlaps = {}
+        for token in tokens:
+            for doc_id in postings.get(token, ()):
+                overlaps[doc_id] = overlaps.get(doc_id, 0) + 1
+        return overlaps
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """Find questions similar to ``query`` (Jaccard similarity over question text tokens)"""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        scored = []
+        for doc_id, shared in self._overlaps(tokens, self.postings).items():
+            score = shared / (len(tokens) + self.docs[doc_id][self.TEXT_TOKENS] - shared)
+            if score > min_score:
+                scored.append((score, doc_id))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._doc_result(doc_id, score) for score, doc_id in scored[:limit]]
+
+    def search_options(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find questions whose options contain the ``query`` tokens
+
+        Scored by the fraction of query tokens found, so long option lists
+        are not penalized.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        scored = [(shared / len(tokens), doc_id)
+                  for doc_id, shared in self._overlaps(tokens, self.option_postings).items()]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._doc_result(doc_id, score) for score, doc_id in scored[:limit]]
+
+    def option_list_reuse(self, min_uses: int = 2) -> List[Dict[str, Any]]:
+        """Option lists used by at least ``min_uses`` questions, most reused first"""
+        reused = []
+        for option_key, doc_ids in self.option_lists.items():
+            if len(doc_ids) < min_uses:
+                continue
+            first = self.docs[min(doc_ids)]
+            reused.append({
+                'option_list': option_key,
+                'options': first[self.OPTIONS],
+                'uses': len(doc_ids),
+                'questions': [self._doc_result(doc_id, 1.0) for doc_id in sorted(doc_ids)]
+            })
+        reused.sort(key=lambda entry: (-entry['uses'], -len(entry['options'])))
+        return reused
+
+    def duplicates(self, threshold: float = 0.8) -> List[List[Dict[str, Any]]]:
+        """Cluster questions whose question text is at least ``threshold`` similar"""
+        parent = {doc_id: doc_id for doc_id in self.docs}
+
+        def find(doc_id):
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        best = {}
+        for doc_id, doc in self.docs.items():
+            tokens = set(tokenize(doc[self.TEXT]))
+            if not tokens:
+                continue
+            for other_id, shared in self._overlaps(tokens, self.postings).items():
+                if other_id <= doc_id:
+                    continue
+                score = shared / (len(tokens) + self.docs[other_id][self.TEXT_TOKENS] - shared)
+                if score >= threshold:
+                    root_a, root_b = find(doc_id), find(other_id)
+                    if root_a != root_b:
+                        parent[root_b] = root_a
+                    best[doc_id] = max(best.get(doc_id, 0), score)
+                    best[other_id] = max(best.get(other_id, 0), score)
+
+        clusters = {}
+        for doc_id in best:
+            clusters.setdefault(find(doc_id), []).append(doc_id)
+
+        result = [
+            [self._doc_result(doc_id, best[doc_id]) for doc_id in sorted(members)]
+            for members in clusters.values()
+        ]
+        result.sort(key=lambda cluster: (-len(cluster), cluster[0]['id']))
+        return result
+
+def main(argv: Optional[List[str]] = None):
+    """Question bank command line"""
+    parser = argparse.ArgumentParser(description='Question bank index for HTML forms')
+    parser.add_argument('--index', default=DEFAULT_INDEX_FILE, help='index file path')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update_cmd = commands.add_parser('update', help='index new or changed HTML files')
+    update_cmd.add_argument('forms_dir', nargs='?', default='old-forms')
+
+    search_cmd = commands.add_parser('search', help='find similar questions')
+    search_cmd.add_argument('query')
+    search_cmd.add_argument('-n', '--limit', type=int, default=10)
+    search_cmd.add_argument('--options', action='store_true', help='search option text instead')
+
+    dup_cmd = commands.add_parser('duplicates', help='cluster duplicate questions')
+    dup_cmd.add_argument('-t', '--threshold', type=float, default=0.8)
+
+    options_cmd = commands.add_parser('options', help='list reused option lists')
+    options_cmd.add_argument('-m', '--min-uses', type=int, default=2)
+
+    args = parser.parse_args(argv)
+    bank = QuestionBank(args.index).load()
+
+    if args.command == 'update':
+        forms_dir = Path(args.forms_dir)
+        if not forms_dir.exists():
+            print(f"❌ Error: Directory '{forms_dir}' not found!")
+            return
+
+        summary = bank.update(sorted(forms_dir.glob("*.html")))
+        bank.save()
+        print(f"📚 Question bank: {len(bank.docs)} questions from {len(bank.files)} files")
+        print(f"   ➕ Added: {len(summary['added'])}  🔄 Updated: {len(summary['updated'])}  "
+              f"➖ Removed: {len(summary['removed'])}  ⏭️  Unchanged: {summary['unchanged']}")
+        for failure in summary['errors']:
+            print(f"   ❌ {failure['file']}: Error - {failure['error']}")
+
+    elif args.command == 'search':
+        if args.options:
+            results = bank.search_options(args.query, args.limit)
+        else:
+            results = bank.search(args.query, args.limit)
+        if not results:
+            print("No matching questions found")
+        for result in results:
+            print(f"[{result['score']:.2f}] {result['question_text'][:70]} "
+                  f"[{result['type']}] - {Path(result['source']).name}")
+            if result['options']:
+                print(f"       Options: {', '.join(result['options'][:8])}")
+
+    elif args.command == 'duplicates':
+        clusters = bank.duplicates(args.threshold)
+        print(f"🔁 Found {len(clusters)} duplicate clusters")
+        for i, cluster in enumerate(clusters, 1):
+            print(f"\n   {i}. {len(cluster)} questions")
+            for result in cluster:
+                print(f"      - {result['question_text'][:70]} - {Path(result['source']).name}")
+
+    elif args.command == 'options':
+        reused = bank.option_list_reuse(args.min_uses)
+        print(f"♻️  Found {len(reused)} reused option lists")
+        for i, entry in enumerate(reused, 1):
+            preview = ', '.join(entry['options'][:5])
+            more = f" (+{len(entry['options']) - 5} more)" if len(entry['options']) > 5 else ''
+            print(f"\n   {i}. {entry['uses']} questions, {len(entry['options'])} options: {preview}{more}")
+            for result in entry['questions']:
+                print(f"      - {result['question_text'][:70]} - {Path(result['source']).name}")
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,11 @@ import os
 import json
 import time
 import re
+import queue
+import asyncio
+import argparse
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup, NavigableString
@@ -18,6 +23,15 @@ from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+try:
+    import aiohttp
+except ImportError:  # Only needed for AsyncGoogleFormCreator
+    aiohttp = None
+
+# Google Forms API per-user quotas (requests per minute)
+FORMS_WRITE_REQUESTS_PER_MINUTE = 150
+FORMS_READ_REQUESTS_PER_MINUTE = 390
+
 class UltimateHTMLFormParser:
     """Ultimate parser that captures everything"""
     
@@ -330,53 +344,403 @@ class UltimateHTMLFormParser:
         
         return result
 
+class UltimateFormValidator:
+    """Pre-flight checks for parsed forms against the Forms API constraints we rely on
+
+    Runs entirely locally so an invalid form is rejected before ``create_form``
+    makes any request, instead of failing part-way and leaving a half-built
+    form behind. Issues the API accepts - over-long text (no documented
+    limits) or an ignored 'Other' flag - are only reported as warnings and
+    do not block upload.
+    """
+    
+    SUPPORTED_TYPES = ('TEXT', 'PARAGRAPH_TEXT', 'MULTIPLE_CHOICE', 'CHECKBOX')
+    CHOICE_TYPES = ('MULTIPLE_CHOICE', 'CHECKBOX')
+    
+    # Our own soft limits for displayed text (warnings only)
+    MAX_FORM_TITLE_LENGTH = 300
+    MAX_QUESTION_TITLE_LENGTH = 300
+    MAX_OPTION_LENGTH = 300
+    MAX_DESCRIPTION_LENGTH = 4000
+    
+    def validate_form(self, form_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return a list of errors for one parsed form (empty when valid)"""
+        errors = []
+        
+        def error(code, message, index=None, question=None):
+            entry = {'code': code, 'message': message}
+            if index is not None:
+                entry['question_index'] = index
+                entry['question_text'] = (question.get('question_text') or '')[:60]
+            errors.append(entry)
+        
+        title = form_data.get('title')
+        if not isinstance(title, str) or not title.strip():
+            error('empty_form_title', "Form title is empty")
+        
+        questions = form_data.get('questions')
+        if not isinstance(questions, list):
+            error('missing_questions', "Form has no question list")
+            return errors
+        
+        for index, question in enumerate(questions, 1):
+            q_type = question.get('type')
+            if q_type not in self.SUPPORTED_TYPES:
+                error('unknown_type', f"Unknown question type: {q_type}", index, question)
+                continue
+            
+            question_text = question.get('question_text')
+            if not isinstance(question_text, str) or not question_text.strip():
+                error('empty_question_title', "Question text is empty", index, question)
+            elif '\n' in question_text or '\r' in question_text:
+                error('newline_in_question_title', "Question text contains a newline", index, question)
+            
+            if not isinstance(question.get('required', False), bool):
+                error('invalid_required', "'required' must be true or false", index, question)
+            
+            if q_type not in self.CHOICE_TYPES:
+                continue
+            
+            options = question.get('options') or []
+            if not options:
+                if question.get('has_other'):
+                    error('only_other_option', "Choice question has only an 'Other' option", index, question)
+                else:
+                    error('no_options', "Choice question has no options", index, question)
+                continue
+            
+            seen = set()
+            for option in options:
+                if not isinstance(option, str) or not option.strip():
+                    error('empty_option', "Option text is empty", index, question)
+                    continue
+                if option in seen:
+                    error('duplicate_option', f"Duplicate option: {option[:40]}", index, question)
+                seen.add(option)
+                if '\n' in option or '\r' in option:
+                    error('newline_in_option', f"Option contains a newline: {option[:40]}", index, question)
+        
+        return errors
+    
+    def form_warnings(self, form_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return non-blocking warnings for one parsed form"""
+        warnings = []
+        
+        def warning(code, message, index=None, question=None):
+            entry = {'code': code, 'message': message}
+            if index is not None:
+                entry['question_index'] = index
+                entry['question_text'] = (question.get('question_text') or '')[:60]
+            warnings.append(entry)
+        
+        def warn(code, text, limit, label, index=None, question=None):
+            if isinstance(text, str) and len(text) > limit:
+                warning(code, f"{label} has {len(text)} characters (soft limit {limit})", index, question)
+        
+        warn('form_title_too_long', form_data.get('title'), self.MAX_FORM_TITLE_LENGTH, "Form title")
+        warn('description_too_long', form_data.get('description'), self.MAX_DESCRIPTION_LENGTH, "Description")
+        
+        for index, question in enumerate(form_data.get('questions') or [], 1):
+            warn('question_title_too_long', question.get('question_text'),
+                 self.MAX_QUESTION_TITLE_LENGTH, "Question text", index, question)
+            for option in question.get('options') or []:
+                warn('option_too_long', option, self.MAX_OPTION_LENGTH, "Option", index, question)
+            
+            # Item building ignores has_other on text questions
+            if question.get('type') not in self.CHOICE_TYPES and question.get('has_other'):
+                warning('other_on_text_question',
+                        f"'Other' option is ignored on {question.get('type')} questions", index, question)
+        
+        return warnings
+    
+    def validate_forms(self, forms: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a batch of parsed forms and build a structured report"""
+        report = self.new_report()
+        
+        for form_data in forms:
+            errors = self.validate_form(form_data)
+            self.add_to_report(report, form_data, errors, warnings=self.form_warnings(form_data))
+        
+        return report
+    
+    def new_report(self) -> Dict[str, Any]:
+        """Empty validation report"""
+        return {
+            'valid': True,
+            'forms_checked': 0,
+            'questions_checked': 0,
+            'invalid_forms': 0,
+            'error_count': 0,
+            'warning_count': 0,
+            'forms': []
+        }
+    
+    def add_to_report(self, report: Dict[str, Any], form_data: Dict[str, Any],
+                      errors: List[Dict[str, Any]], source: str = None,
+                      warnings: List[Dict[str, Any]] = None):
+        """Record the result of ``validate_form`` and ``form_warnings`` in a report"""
+        warnings = warnings or []
+        report['forms_checked'] += 1
+        report['questions_checked'] += len(form_data.get('questions') or [])
+        if not errors and not warnings:
+            return
+        
+        if errors:
+            report['valid'] = False
+            report['invalid_forms'] += 1
+        report['error_count'] += len(errors)
+        report['warning_count'] += len(warnings)
+        report['forms'].append({
+            'title': form_data.get('title'),
+            'source': source or form_data.get('description'),
+            'errors': errors,
+            'warnings': warnings
+        })
+
+class OptionCatalog:
+    """Interned option lists and memoized Forms API items
+
+    Generated forms reuse the same large choice lists (districts, upazilas)
+    across many questions and forms. Each distinct option list is built and
+    JSON-encoded once, then shared by every question that uses it - only
+    the small title/required wrapper differs per question. Returned objects
+    are shared - do not mutate them.
+
+    Caches are LRU-bounded so memory stays flat over a large corpus.
+    """
+    
+    def __init__(self, max_option_lists: int = 256, max_items: int = 2048):
+        self.max_option_lists = max_option_lists
+        self.max_items = max_items
+        self._options = OrderedDict()
+        self._options_json = OrderedDict()
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get(self, cache: OrderedDict, key):
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _put(self, cache: OrderedDict, key, value, limit: int):
+        """Store a value unless another thread already did, evicting the oldest"""
+        with self._lock:
+            existing = cache.get(key)
+            if existing is not None:
+                cache.move_to_end(key)
+                return existing
+            cache[key] = value
+            while len(cache) > limit:
+                cache.popitem(last=False)
+            return value
+    
+    def clear(self):
+        """Drop all cached option lists and items"""
+        with self._lock:
+            self._options.clear()
+            self._options_json.clear()
+            self._items.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Number of interned option lists and cached items"""
+        return {
+            'option_lists': len(self._options),
+            'options_json': len(self._options_json),
+            'items': len(self._items)
+        }
+    
+    def _option_key(self, question_data: Dict[str, Any]) -> tuple:
+        return (tuple(question_data.get('options') or ()), bool(question_data.get('has_other', False)))
+    
+    def _interned(self, key: tuple) -> List[Dict[str, Any]]:
+        interned = self._get(self._options, key)
+        if interned is None:
+            options, has_other = key
+            interned = [{"value": option} for option in options]
+            
+            # Add "Other" option - CORRECT WAY
+            if has_other:
+                interned.append({"isOther": True})
+            
+            interned = self._put(self._options, key, interned, self.max_option_lists)
+        return interned
+    
+    def intern_options(self, options: List[str], has_other: bool = False) -> List[Dict[str, Any]]:
+        """Shared ``[{"value": ...}]`` list for an option list"""
+        return self._interned((tuple(options), bool(has_other)))
+    
+    def _encoded_options(self, key: tuple) -> str:
+        encoded = self._get(self._options_json, key)
+        if encoded is None:
+            encoded = json.dumps(self._interned(key), ensure_ascii=False, separators=(',', ':'))
+            encoded = self._put(self._options_json, key, encoded, self.max_option_lists)
+        return encoded
+    
+    def item(self, question_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Forms API item for a parsed question, built once per question shape"""
+        return self._item(question_data, self._option_key(question_data))
+    
+    def _item(self, question_data: Dict[str, Any], option_key: tuple) -> Dict[str, Any]:
+        shape = (
+            question_data['type'],
+            question_data['question_text'],
+            bool(question_data.get('required', False)),
+            option_key
+        )
+        question_item = self._get(self._items, shape)
+        if question_item is None:
+            question_item = self._put(self._items, shape, self._build_item(question_data, option_key),
+                                      self.max_items)
+        return question_item
+    
+    def item_json(self, question_data: Dict[str, Any]) -> str:
+        """Serialized item JSON for a parsed question
+
+        Choice items splice the once-encoded options array into a small
+        per-question wrapper, so a shared list is never re-encoded.
+        """
+        option_key = self._option_key(question_data)
+        q_type = question_data['type']
+        
+        if q_type not in ('MULTIPLE_CHOICE', 'CHECKBOX'):
+            return json.dumps(self._item(question_data, option_key), ensure_ascii=False, separators=(',', ':'))
+        
+        required = 'true' if question_data.get('required', False) else 'false'
+        choice_type = 'RADIO' if q_type == 'MULTIPLE_CHOICE' else 'CHECKBOX'
+        return (
+            f'{{"title":{json.dumps(question_data["question_text"], ensure_ascii=False)},'
+            f'"questionItem":{{"question":{{"required":{required},'
+            f'"choiceQuestion":{{"type":"{choice_type}","options":{self._encoded_options(option_key)}}}}}}}}}'
+        )
+    
+    def _build_item(self, question_data: Dict[str, Any], option_key: tuple) -> Dict[str, Any]:
+        """Map a parsed question to a Forms API item"""
+        
+        # Question text - Google Forms will automatically make it bold/prominent
+        question_title = question_data['question_text']
+        required = question_data.get('required', False)
+        
+        if question_data['type'] in ('TEXT', 'PARAGRAPH_TEXT'):
+            question = {
+                "required": required,
+                "textQuestion": {
+                    "paragraph": question_data['type'] == 'PARAGRAPH_TEXT'
+                }
+            }
+        elif question_data['type'] in ('MULTIPLE_CHOICE', 'CHECKBOX'):
+            question = {
+                "required": required,
+                "choiceQuestion": {
+                    "type": "RADIO" if question_data['type'] == 'MULTIPLE_CHOICE' else "CHECKBOX",
+                    "options": self._interned(option_key)
+                }
+            }
+        else:
+            raise ValueError(f"Unknown question type: {question_data['type']}")
+        
+        return {
+            "title": question_title,
+            "questionItem": {
+                "question": question
+            }
+        }
+
+OPTION_CATALOG = OptionCatalog()
+
+def load_credentials(credentials_file: str = None) -> Optional[Credentials]:
+    """Load OAuth credentials from token.json, refreshing or re-authorizing as needed"""
+    SCOPES = ['https://www.googleapis.com/auth/forms.body']
+    
+    creds = None
+    
+    if os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            if credentials_file and os.path.exists(credentials_file):
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    credentials_file, SCOPES)
+                creds = flow.run_local_server(port=0)
+            else:
+                print("Error: No credentials file found!")
+                return None
+        
+        with open('token.json', 'w') as token:
+            token.write(creds.to_json())
+    
+    return creds
+
+class RateLimiter:
+    """Thread-safe token bucket shared by synchronous creators
+
+    Every ``UltimateGoogleFormCreator`` in a pipeline acquires from the same
+    limiter before each ``execute()``, so the combined write rate stays under
+    the per-user quota however many upload threads run.
+    """
+    
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 1):
+        self.rate = rate
+        self.per = per
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                time.sleep((1 - self._tokens) * self.per / self.rate)
+
 class UltimateGoogleFormCreator:
     """Ultimate Google Form creator with proper formatting"""
     
-    def __init__(self, credentials_file: str = None):
+    # Built-in pauses to stay under the Forms API rate limits (seconds)
+    QUESTION_DELAY = 0.3
+    FORM_DELAY = 3
+    
+    def __init__(self, credentials_file: str = None, rate_limiter: Optional[RateLimiter] = None):
         self.credentials_file = credentials_file
+        self.rate_limiter = rate_limiter
         self.service = None
         self._setup_service()
     
     def _setup_service(self):
         """Setup service"""
-        SCOPES = ['https://www.googleapis.com/auth/forms.body']
-        
-        creds = None
-        
-        if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if self.credentials_file and os.path.exists(self.credentials_file):
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.credentials_file, SCOPES)
-                    creds = flow.run_local_server(port=0)
-                else:
-                    print("Error: No credentials file found!")
-                    return
-            
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+        creds = load_credentials(self.credentials_file)
+        if not creds:
+            return
         
         self.service = build('forms', 'v1', credentials=creds)
     
+    def _execute(self, request):
+        """Execute an API request, waiting on the shared rate limiter first"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        return request.execute()
+    
     def create_form(self, form_data: Dict[str, Any]) -> str:
         """Create ultimate Google Form"""
         if not self.service:
             raise Exception("Google Forms service not initialized")
         
         # Create form
-        form = {
-            "info": {
-                "title": form_data['title']
-            }
-        }
+        form = self.build_create_request(form_data)
         
-        result = self.service.forms().create(body=form).execute()
+        result = self._execute(self.service.forms().create(body=form))
         form_id = result['formId']
         
         print(f"✅ Created form: {form_data['title']}")
@@ -384,19 +748,10 @@ class UltimateGoogleFormCreator:
         
         # Add description
         if form_data.get('description'):
-            desc_request = {
-                "requests": [{
-                    "updateFormInfo": {
-                        "info": {
-                            "description": form_data['description']
-                        },
-                        "updateMask": "description"
-                    }
-                }]
-            }
+            desc_request = self.build_description_request(form_data['description'])
             
             try:
-                self.service.forms().batchUpdate(formId=form_id, body=desc_request).execute()
+                self._execute(self.service.forms().batchUpdate(formId=form_id, body=desc_request))
                 print(f"   ✅ Added description")
             except Exception as e:
                 print(f"   ⚠️  Warning: Could not add description: {e}")
@@ -408,110 +763,812 @@ class UltimateGoogleFormCreator:
                 self._add_question_ultimate(form_id, question)
                 questions_added += 1
                 print(f"   ✅ Added question {questions_added}/{len(form_data['questions'])}: {question['question_text'][:50]}...")
-                time.sleep(0.3)
+                time.sleep(self.QUESTION_DELAY)
             except Exception as e:
                 print(f"   ⚠️  Warning: Could not add question: {e}")
         
         print(f"   📊 Successfully added {questions_added}/{len(form_data['questions'])} questions")
         return form_id
     
+    @staticmethod
+    def build_create_request(form_data: Dict[str, Any]) -> Dict[str, Any]:
+        """forms.create body for a parsed form"""
+        return {
+            "info": {
+                "title": form_data['title']
+            }
+        }
+    
+    @staticmethod
+    def build_description_request(description: str) -> Dict[str, Any]:
+        """forms.batchUpdate body that sets the form description"""
+        return {
+            "requests": [{
+                "updateFormInfo": {
+                    "info": {
+                        "description": description
+                    },
+                    "updateMask": "description"
+                }
+            }]
+        }
+    
+    @staticmethod
+    def build_question_item(question_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a parsed question to a Forms API item (shared via OPTION_CATALOG - do not mutate)"""
+        return OPTION_CATALOG.item(question_data)
+    
+    @classmethod
+    def build_question_request(cls, question_data: Dict[str, Any]) -> Dict[str, Any]:
+        """forms.batchUpdate body that adds one question at the top of the form"""
+        return {
+            "requests": [{
+                "createItem": {
+                    "item": cls.build_question_item(question_data),
+                    "location": {"index": 0}
+                }
+            }]
+        }
+    
     def _add_question_ultimate(self, form_id: str, question_data: Dict[str, Any]):
         """Add question with ultimate formatting"""
+        request = self.build_question_request(question_data)
         
-        # Question text - Google Forms will automatically make it bold/prominent
-        question_title = question_data['question_text']
+        # Add question to form
+        self._execute(self.service.forms().batchUpdate(formId=form_id, body=request))
+
+class FormCreationError(Exception):
+    """A form was created but could not be filled in"""
+    
+    def __init__(self, message: str, form_id: str):
+        super().__init__(message)
+        self.form_id = form_id
+
+class AsyncRateLimiter:
+    """Token bucket rate limiter for asyncio tasks
+
+    Starts with a one-token burst like ``RateLimiter``, so no ``per`` window
+    sees more than ``rate`` requests even from a fresh or idle limiter.
+    """
+    
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 1):
+        self.rate = rate
+        self.per = per
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate / self.per)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+class AsyncGoogleFormCreator:
+    """Asyncio Google Form creator over a pooled aiohttp session
+
+    Covers the ``create``, ``batchUpdate`` and ``get`` Forms API methods so a
+    single event loop can drive thousands of in-flight form operations
+    without threads. Items are built with the same mapping as
+    ``UltimateGoogleFormCreator``. Use as ``async with``.
+    """
+    
+    API_ROOT = 'https://forms.googleapis.com/v1/forms'
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, credentials_file: str = None, max_connections: int = 20,
+                 write_requests_per_minute: int = FORMS_WRITE_REQUESTS_PER_MINUTE,
+                 read_requests_per_minute: int = FORMS_READ_REQUESTS_PER_MINUTE,
+                 max_retries: int = 5):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncGoogleFormCreator (pip install aiohttp)")
         
-        if question_data['type'] == 'TEXT':
-            question_item = {
-                "title": question_title,
-                "questionItem": {
-                    "question": {
-                        "required": question_data.get('required', False),
-                        "textQuestion": {
-                            "paragraph": False
-                        }
-                    }
-                }
-            }
-        elif question_data['type'] == 'PARAGRAPH_TEXT':
-            question_item = {
-                "title": question_title,
-                "questionItem": {
-                    "question": {
-                        "required": question_data.get('required', False),
-                        "textQuestion": {
-                            "paragraph": True
-                        }
-                    }
-                }
-            }
-        elif question_data['type'] == 'MULTIPLE_CHOICE':
-            options = []
-            for option in question_data['options']:
-                options.append({"value": option})
-            
-            choice_question = {
-                "type": "RADIO",
-                "options": options
+        self.credentials_file = credentials_file
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.write_limiter = AsyncRateLimiter(write_requests_per_minute)
+        self.read_limiter = AsyncRateLimiter(read_requests_per_minute)
+        self.creds = load_credentials(credentials_file)
+        self.session = None
+        self._refresh_lock = None
+    
+    async def __aenter__(self) -> 'AsyncGoogleFormCreator':
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def open(self):
+        """Open the pooled HTTP session"""
+        if not self.creds:
+            raise Exception("Google Forms credentials not initialized")
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(connector=connector)
+            self._refresh_lock = asyncio.Lock()
+    
+    async def close(self):
+        """Close the HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def _access_token(self) -> str:
+        """Current access token, refreshed off the event loop when expired"""
+        async with self._refresh_lock:
+            if not self.creds.valid:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.creds.refresh, Request())
+        return self.creds.token
+    
+    async def _request(self, method: str, url: str, limiter: AsyncRateLimiter,
+                       body: Any = None, idempotent: bool = False) -> Dict[str, Any]:
+        """Send one API request with rate limiting and retries
+
+        ``body`` is either a dict or an already serialized JSON string.
+        Failed connects and 429s are always retried because the request was
+        not processed. 5xx responses, timeouts and dropped connections are
+        only retried for ``idempotent`` requests - retrying a ``create`` or
+        ``batchUpdate`` the server may already have applied would duplicate
+        forms or items.
+        """
+        if self.session is None:
+            raise Exception("AsyncGoogleFormCreator session not opened")
+        
+        data = None
+        if isinstance(body, str):
+            data = body.encode('utf-8')
+        elif body is not None:
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        
+        retry_statuses = self.RETRY_STATUSES if idempotent else (429,)
+        
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            await limiter.acquire()
+            headers = {
+                'Authorization': f"Bearer {await self._access_token()}",
+                'Content-Type': 'application/json; charset=utf-8'
             }
-            
-            # Add "Other" option - CORRECT WAY
-            if question_data.get('has_other', False):
-                choice_question["options"].append({
-                    "isOther": True
-                })
-            
-            question_item = {
-                "title": question_title,
-                "questionItem": {
-                    "question": {
-                        "required": question_data.get('required', False),
-                        "choiceQuestion": choice_question
+            try:
+                async with self.session.request(method, url, data=data, headers=headers) as response:
+                    if response.status in retry_statuses and retries_left:
+                        retry_after = response.headers.get('Retry-After')
+                        delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                        await asyncio.sleep(delay)
+                        continue
+                    
+                    text = await response.text()
+                    try:
+                        payload = json.loads(text) if text else {}
+                    except ValueError:
+                        payload = None
+                    
+                    if response.status >= 400:
+                        if isinstance(payload, dict) and isinstance(payload.get('error'), dict):
+                            message = payload['error'].get('message', response.reason)
+                        else:
+                            message = text[:200] or response.reason
+                        raise Exception(f"Forms API {method} {url} failed ({response.status}): {message}")
+                    if payload is None:
+                        raise Exception(f"Forms API {method} {url} returned invalid JSON: {text[:200]}")
+                    return payload
+            except aiohttp.ClientConnectorError:
+                if not retries_left:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if not (idempotent and retries_left):
+                    raise
+            await asyncio.sleep(2 ** attempt)
+    
+    async def create(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        """forms.create"""
+        return await self._request('POST', self.API_ROOT, self.write_limiter, form)
+    
+    async def batch_update(self, form_id: str, body: Any) -> Dict[str, Any]:
+        """forms.batchUpdate"""
+        return await self._request('POST', f"{self.API_ROOT}/{form_id}:batchUpdate", self.write_limiter, body)
+    
+    async def get(self, form_id: str) -> Dict[str, Any]:
+        """forms.get"""
+        return await self._request('GET', f"{self.API_ROOT}/{form_id}", self.read_limiter, idempotent=True)
+    
+    async def create_form(self, form_data: Dict[str, Any]) -> str:
+        """Create a form with its description and all questions
+
+        Uses one ``create`` and one ``batchUpdate`` call per form: the
+        description and every question item go in a single batch, inserted
+        at ascending indexes so they keep their parsed order.
+        """
+        result = await self.create(UltimateGoogleFormCreator.build_create_request(form_data))
+        form_id = result['formId']
+        
+        body = self.build_batch_body(form_data)
+        if body:
+            try:
+                await self.batch_update(form_id, body)
+            except Exception as e:
+                # The batch is atomic, so the form exists but is empty
+                raise FormCreationError(f"{e} (empty form {form_id} left behind)", form_id) from e
+        
+        return form_id
+    
+    @staticmethod
+    def build_batch_body(form_data: Dict[str, Any]) -> Optional[str]:
+        """Serialized batchUpdate body with the description and every question
+
+        Assembled from cached item JSON instead of re-encoding identical
+        option lists for every question and form.
+        """
+        requests = []
+        if form_data.get('description'):
+            requests.append(json.dumps(
+                UltimateGoogleFormCreator.build_description_request(form_data['description'])['requests'][0],
+                ensure_ascii=False, separators=(',', ':')))
+        
+        for index, question in enumerate(form_data['questions']):
+            requests.append(
+                f'{{"createItem":{{"item":{OPTION_CATALOG.item_json(question)},'
+                f'"location":{{"index":{index}}}}}}}'
+            )
+        
+        if not requests:
+            return None
+        return '{"requests":[' + ','.join(requests) + ']}'
+    
+    async def create_form_result(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create one form and describe the outcome instead of raising"""
+        try:
+            form_id = await self.create_form(form_data)
+        except Exception as e:
+            print(f"❌ Error creating form '{form_data['title']}': {e}")
+            failure = {'title': form_data['title'], 'error': str(e)}
+            orphaned_form_id = getattr(e, 'form_id', None)
+            if orphaned_form_id:
+                failure['orphaned_form_id'] = orphaned_form_id
+                failure['edit_url'] = f"https://docs.google.com/forms/d/{orphaned_form_id}/edit"
+            return failure
+        
+        print(f"🎉 Successfully created: {form_data['title']}")
+        return {
+            'title': form_data['title'],
+            'form_id': form_id,
+            'edit_url': f"https://docs.google.com/forms/d/{form_id}/edit",
+            'response_url': f"https://docs.google.com/forms/d/{form_id}/viewform",
+            'questions_count': len(form_data['questions'])
+        }
+    
+    async def create_forms(self, forms: List[Dict[str, Any]], concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Create many forms concurrently, returning one result per form in order"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def create_one(form_data):
+            async with semaphore:
+                return await self.create_form_result(form_data)
+        
+        return await asyncio.gather(*(create_one(form_data) for form_data in forms))
+
+class ParsedFormsWriter:
+    """Write parsed forms to a JSON array incrementally, in file order
+
+    Forms may finish parsing out of order; each is buffered until every
+    lower file index has been written or skipped, so the output matches
+    the input file order without holding the whole corpus in memory.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self._file = open(path, 'w', encoding='utf-8') if path else None
+        self._pending = {}
+        self._next_index = 0
+        self._written = 0
+        self._lock = threading.Lock()
+        if self._file:
+            self._file.write('[')
+
+    def add(self, index: int, form_data: Optional[Dict[str, Any]]):
+        """Record the form for file ``index`` (None for a file that failed to parse)"""
+        with self._lock:
+            self._pending[index] = form_data
+            while self._next_index in self._pending:
+                ready = self._pending.pop(self._next_index)
+                self._next_index += 1
+                if ready is None or not self._file:
+                    continue
+                if self._written:
+                    self._file.write(',')
+                self._file.write('\n')
+                json.dump(ready, self._file, ensure_ascii=False, indent=2)
+                self._written += 1
+
+    def close(self):
+        """Finish the JSON array"""
+        if self._file:
+            self._file.write('\n]\n')
+            self._file.close()
+            self._file = None
+
+class UltimateFormPipeline:
+    """Stream parsed forms from parser workers to creator workers
+
+    Parser threads push each parsed form into a bounded queue as soon as it
+    is ready, and creator threads drain it concurrently. A full queue blocks
+    the parsers, so only ``queue_size`` parsed forms are held in memory at a
+    time and parsing overlaps with network waits.
+
+    All creators share one write rate limiter and form starts are spaced by
+    ``FORM_DELAY`` across all workers, so adding upload workers overlaps
+    latency without raising the write rate above the quota.
+    """
+
+    _DONE = object()
+
+    def __init__(self, credentials_file: str, parse_workers: int = 2,
+                 upload_workers: int = 2, queue_size: int = 4,
+                 parsed_output: Optional[str] = 'parsed_forms_ultimate.json',
+                 validation_output: Optional[str] = 'validation_report_ultimate.json'):
+        self.credentials_file = credentials_file
+        self.parse_workers = max(1, parse_workers)
+        self.upload_workers = max(1, upload_workers)
+        self.queue_size = max(1, queue_size)
+        self.parsed_output = parsed_output
+        self.validation_output = validation_output
+        self.validator = UltimateFormValidator()
+        self.rate_limiter = RateLimiter(FORMS_WRITE_REQUESTS_PER_MINUTE)
+        self._print_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._form_lock = threading.Lock()
+        self._next_form_at = None
+
+    def _log(self, message: str):
+        """Print without interleaving lines from different workers"""
+        with self._print_lock:
+            print(message)
+
+    def _wait_for_form_slot(self):
+        """Space form starts by FORM_DELAY across all upload workers"""
+        with self._form_lock:
+            now = time.monotonic()
+            start = now if self._next_form_at is None else max(now, self._next_form_at)
+            self._next_form_at = start + UltimateGoogleFormCreator.FORM_DELAY
+        
+        if start > now:
+            self._log(f"⏳ Waiting {start - now:.1f} seconds to avoid rate limits...")
+            time.sleep(start - now)
+
+    def _create_creators(self) -> List['UltimateGoogleFormCreator']:
+        """One creator per upload worker - httplib2 is not thread safe"""
+        creators = []
+        for _ in range(self.upload_workers):
+            # The first creator may run the OAuth flow and write token.json,
+            # the rest pick the token up from disk
+            creator = UltimateGoogleFormCreator(self.credentials_file, self.rate_limiter)
+            if not creator.service:
+                raise Exception("Google Forms service not initialized")
+            creators.append(creator)
+        return creators
+
+    def run(self, html_files: List[Path]) -> Dict[str, Any]:
+        """Parse and upload all files, returning created forms and failures"""
+        creators = self._create_creators()
+
+        files = queue.Queue()
+        for index, html_file in enumerate(html_files):
+            files.put((index, html_file))
+
+        forms = queue.Queue(maxsize=self.queue_size)
+        state = {
+            'parsed_count': 0,
+            'total_questions': 0,
+            'parse_failures': [],
+            'validation_report': self.validator.new_report(),
+            'created_forms': [],
+            'create_failures': [],
+        }
+
+        parsed_writer = ParsedFormsWriter(self.parsed_output)
+
+        def parse_worker():
+            parser = UltimateHTMLFormParser()
+            while True:
+                try:
+                    index, html_file = files.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    form_data = parser.parse_html_file(str(html_file))
+                except Exception as e:
+                    self._log(f"   ❌ {html_file.name}: Error - {e}")
+                    with self._state_lock:
+                        state['parse_failures'].append({'file': html_file.name, 'error': str(e)})
+                    parsed_writer.add(index, None)
+                    continue
+
+                lines = [f"   ✅ {html_file.name}: {form_data['title']} ({len(form_data['questions'])} questions)"]
+                for i, q in enumerate(form_data['questions'], 1):
+                    has_other = ' (+Other)' if q.get('has_other') else ''
+                    lines.append(f"      {i}. {q['question_text'][:60]}... [{q['type']}{has_other}]")
+                self._log("\n".join(lines))
+
+                # Pre-flight validation - invalid forms never reach the API
+                errors = self.validator.validate_form(form_data)
+                warnings = self.validator.form_warnings(form_data)
+                with self._state_lock:
+                    self.validator.add_to_report(state['validation_report'], form_data, errors,
+                                                 html_file.name, warnings)
+                if errors:
+                    lines = [f"   ❌ {html_file.name}: {len(errors)} validation error(s), skipping upload"]
+                    for err in errors:
+                        where = f" (question {err['question_index']})" if 'question_index' in err else ''
+                        lines.append(f"      - [{err['code']}]{where} {err['message']}")
+                    self._log("\n".join(lines))
+
+                parsed_writer.add(index, form_data)
+                with self._state_lock:
+                    state['parsed_count'] += 1
+                    state['total_questions'] += len(form_data['questions'])
+
+                if errors:
+                    continue
+
+                # Blocks while the creators are behind (backpressure)
+                forms.put((index, form_data))
+
+        def upload_worker(creator):
+            while True:
+                item = forms.get()
+                if item is self._DONE:
+                    return
+                index, form_data = item
+                try:
+                    self._wait_for_form_slot()
+
+                    self._log(f"\n🏗️  Creating: {form_data['title']}")
+                    form_id = creator.create_form(form_data)
+
+                    created_form = {
+                        'title': form_data['title'],
+                        'form_id': form_id,
+                        'edit_url': f"https://docs.google.com/forms/d/{form_id}/edit",
+                        'response_url': f"https://docs.google.com/forms/d/{form_id}/viewform",
+                        'questions_count': len(form_data['questions'])
                     }
-                }
-            }
-        elif question_data['type'] == 'CHECKBOX':
-            options = []
-            for option in question_data['options']:
-                options.append({"value": option})
-            
-            choice_question = {
-                "type": "CHECKBOX",
-                "options": options
-            }
+                    with self._state_lock:
+                        state['created_forms'].append((index, created_form))
+                    self._log(f"🎉 Successfully created: {form_data['title']}")
+                except Exception as e:
+                    self._log(f"❌ Error creating form '{form_data['title']}': {e}")
+                    with self._state_lock:
+                        state['create_failures'].append({'title': form_data['title'], 'error': str(e)})
+
+        parsers = [threading.Thread(target=parse_worker, daemon=True)
+                   for _ in range(self.parse_workers)]
+        uploaders = [threading.Thread(target=upload_worker, args=(creator,), daemon=True)
+                     for creator in creators]
+
+        try:
+            for thread in parsers + uploaders:
+                thread.start()
+            for thread in parsers:
+                thread.join()
+            for _ in uploaders:
+                forms.put(self._DONE)
+            for thread in uploaders:
+                thread.join()
+        finally:
+            parsed_writer.close()
+
+        if self.validation_output:
+            with open(self.validation_output, 'w', encoding='utf-8') as f:
+                json.dump(state['validation_report'], f, ensure_ascii=False, indent=2)
+
+        # Keep the original file order in the results
+        state['created_forms'] = [form for _, form in sorted(state['created_forms'], key=lambda f: f[0])]
+        return state
+
+class UltimateRequestPlanner:
+    """Dry-run plan of the Forms API requests a rollout will make
+
+    Builds the same request bodies as the creators without sending them and
+    reports call counts per method, payload sizes, quota windows and the
+    predicted wall-clock time for the chosen creation strategy:
+
+    - ``pipeline``: UltimateFormPipeline / UltimateGoogleFormCreator, one
+      batchUpdate per question plus the built-in sleeps
+    - ``async``: AsyncGoogleFormCreator, one create and one batchUpdate per form
+    """
+    
+    STRATEGIES = ('pipeline', 'async')
+    WRITE_METHODS = ('forms.create', 'forms.batchUpdate')
+    
+    def __init__(self, strategy: str = 'pipeline', upload_workers: int = 2,
+                 concurrency: int = 10, latency: float = 0.5,
+                 write_requests_per_minute: int = FORMS_WRITE_REQUESTS_PER_MINUTE):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.strategy = strategy
+        self.upload_workers = max(1, upload_workers)
+        self.concurrency = max(1, concurrency)
+        self.latency = latency
+        self.write_requests_per_minute = write_requests_per_minute
+    
+    def _form_requests(self, form_data: Dict[str, Any]) -> List[tuple]:
+        """(method, payload bytes) for every call made for one form"""
+        create_body = UltimateGoogleFormCreator.build_create_request(form_data)
+        
+        if self.strategy == 'pipeline':
+            # googleapiclient serializes bodies with json.dumps defaults (ASCII escapes)
+            calls = [('forms.create', len(json.dumps(create_body)))]
+            if form_data.get('description'):
+                body = UltimateGoogleFormCreator.build_description_request(form_data['description'])
+                calls.append(('forms.batchUpdate', len(json.dumps(body))))
+            for question in form_data['questions']:
+                body = UltimateGoogleFormCreator.build_question_request(question)
+                calls.append(('forms.batchUpdate', len(json.dumps(body))))
+            return calls
+        
+        calls = [('forms.create', len(json.dumps(create_body, ensure_ascii=False).encode('utf-8')))]
+        body = AsyncGoogleFormCreator.build_batch_body(form_data)
+        if body:
+            calls.append(('forms.batchUpdate', len(body.encode('utf-8'))))
+        return calls
+    
+    def _makespan(self, form_seconds: List[float]) -> float:
+        """Simulate workers taking the next form from the queue as they free up
+
+        The pipeline spaces form starts by FORM_DELAY across all workers.
+        """
+        slots = self.upload_workers if self.strategy == 'pipeline' else self.concurrency
+        form_delay = UltimateGoogleFormCreator.FORM_DELAY if self.strategy == 'pipeline' else 0
+        free_at = [0.0] * slots
+        next_form_at = 0.0
+        
+        for seconds in form_seconds:
+            slot = min(range(slots), key=lambda i: free_at[i])
+            start = max(free_at[slot], next_form_at)
+            next_form_at = start + form_delay
+            free_at[slot] = start + seconds
+        
+        return max(free_at) if form_seconds else 0.0
+    
+    def plan(self, forms: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the request plan for parsed forms"""
+        methods = {}
+        per_form = []
+        form_seconds = []
+        
+        for form_data in forms:
+            calls = self._form_requests(form_data)
+            for method, size in calls:
+                entry = methods.setdefault(method, {'calls': 0, 'bytes': 0, 'max_bytes': 0})
+                entry['calls'] += 1
+                entry['bytes'] += size
+                entry['max_bytes'] = max(entry['max_bytes'], size)
             
-            # Add "Other" option - CORRECT WAY
-            if question_data.get('has_other', False):
-                choice_question["options"].append({
-                    "isOther": True
-                })
+            seconds = len(calls) * self.latency
+            if self.strategy == 'pipeline':
+                seconds += len(form_data['questions']) * UltimateGoogleFormCreator.QUESTION_DELAY
+            form_seconds.append(seconds)
             
-            question_item = {
-                "title": question_title,
-                "questionItem": {
-                    "question": {
-                        "required": question_data.get('required', False),
-                        "choiceQuestion": choice_question
-                    }
-                }
-            }
-        else:
-            raise ValueError(f"Unknown question type: {question_data['type']}")
+            per_form.append({
+                'title': form_data['title'],
+                'questions': len(form_data['questions']),
+                'calls': len(calls),
+                'bytes': sum(size for _, size in calls),
+                'max_payload_bytes': max(size for _, size in calls),
+                'estimated_seconds': round(seconds, 2)
+            })
         
-        # Add question to form
-        request = {
-            "requests": [{
-                "createItem": {
-                    "item": question_item,
-                    "location": {"index": 0}
-                }
-            }]
+        total_calls = sum(entry['calls'] for entry in methods.values())
+        write_calls = sum(methods[m]['calls'] for m in self.WRITE_METHODS if m in methods)
+        rpm = self.write_requests_per_minute
+        
+        # Both strategies throttle writes with a one-token bucket refilling
+        # at rpm, so writes are delayed (not failed) and no minute sees more
+        # than rpm of them
+        quota_windows = -(-write_calls // rpm) if write_calls else 0
+        quota_floor = write_calls / rpm * 60
+        makespan = self._makespan(form_seconds)
+        total_seconds = max(makespan, quota_floor)
+        
+        warnings = []
+        if quota_floor > makespan:
+            workers = '--upload-workers' if self.strategy == 'pipeline' else '--concurrency'
+            warnings.append(
+                f"Write quota is the bottleneck: the rate limiter holds {write_calls} writes to "
+                f"{rpm}/min, so raising {workers} will not shorten the run"
+            )
+        
+        return {
+            'strategy': self.strategy,
+            'forms': len(forms),
+            'questions': sum(len(form_data['questions']) for form_data in forms),
+            'assumptions': {
+                'latency_seconds': self.latency,
+                'upload_workers': self.upload_workers if self.strategy == 'pipeline' else None,
+                'concurrency': self.concurrency if self.strategy == 'async' else None,
+                'question_delay_seconds': UltimateGoogleFormCreator.QUESTION_DELAY if self.strategy == 'pipeline' else 0,
+                'form_delay_seconds': UltimateGoogleFormCreator.FORM_DELAY if self.strategy == 'pipeline' else 0,
+                'write_requests_per_minute': rpm
+            },
+            'calls': methods,
+            'total_calls': total_calls,
+            'write_calls': write_calls,
+            'payload_bytes': {
+                'total': sum(entry['bytes'] for entry in methods.values()),
+                'max': max((entry['max_bytes'] for entry in methods.values()), default=0)
+            },
+            'quota': {
+                'windows': quota_windows,
+                'min_seconds': round(quota_floor, 2)
+            },
+            'estimated_seconds': {
+                'limited_by': 'quota' if quota_floor > makespan else 'workers',
+                'workers': round(makespan, 2),
+                'quota_floor': round(quota_floor, 2),
+                'total': round(total_seconds, 2)
+            },
+            'warnings': warnings,
+            'per_form': per_form
         }
+
+def parse_forms(html_files: List[Path], validator: 'UltimateFormValidator') -> Dict[str, Any]:
+    """Parse and validate all files up front for plan mode"""
+    parser = UltimateHTMLFormParser()
+    result = {
+        'forms': [],
+        'parsed_count': 0,
+        'total_questions': 0,
+        'parse_failures': [],
+        'validation_report': validator.new_report()
+    }
+    
+    for html_file in html_files:
+        try:
+            form_data = parser.parse_html_file(str(html_file))
+        except Exception as e:
+            print(f"   ❌ {html_file.name}: Error - {e}")
+            result['parse_failures'].append({'file': html_file.name, 'error': str(e)})
+            continue
+        
+        print(f"   ✅ {html_file.name}: {form_data['title']} ({len(form_data['questions'])} questions)")
+        result['parsed_count'] += 1
+        result['total_questions'] += len(form_data['questions'])
+        
+        errors = validator.validate_form(form_data)
+        validator.add_to_report(result['validation_report'], form_data, errors, html_file.name,
+                                validator.form_warnings(form_data))
+        if errors:
+            print(f"   ❌ {html_file.name}: {len(errors)} validation error(s), skipping")
+            continue
         
-        self.service.forms().batchUpdate(formId=form_id, body=request).execute()
+        result['forms'].append(form_data)
+    
+    return result
+
+async def create_forms_async(credentials_file: str, html_files: List[Path], concurrency: int = 10,
+                             parse_workers: int = 2, queue_size: int = 4,
+                             parsed_output: Optional[str] = 'parsed_forms_ultimate.json',
+                             validation_output: Optional[str] = 'validation_report_ultimate.json') -> Dict[str, Any]:
+    """Stream parsed forms into AsyncGoogleFormCreator on one event loop
 
-def main():
+    The async counterpart of ``UltimateFormPipeline.run``: parser tasks run
+    ``UltimateHTMLFormParser`` in the default executor and push valid forms
+    into a bounded ``asyncio.Queue``, which ``concurrency`` creator tasks
+    drain. A full queue pauses the parsers, so memory stays at
+    ``queue_size`` parsed forms and parsing overlaps with uploads.
+    """
+    validator = UltimateFormValidator()
+    parsed_writer = ParsedFormsWriter(parsed_output)
+    state = {
+        'parsed_count': 0,
+        'total_questions': 0,
+        'parse_failures': [],
+        'validation_report': validator.new_report(),
+        'created_forms': [],
+        'create_failures': [],
+    }
+    
+    files = iter(enumerate(html_files))
+    forms = asyncio.Queue(maxsize=max(1, queue_size))
+    done = object()
+    loop = asyncio.get_running_loop()
+    
+    async def parse_worker():
+        parser = UltimateHTMLFormParser()
+        for index, html_file in files:
+            try:
+                form_data = await loop.run_in_executor(None, parser.parse_html_file, str(html_file))
+            except Exception as e:
+                print(f"   ❌ {html_file.name}: Error - {e}")
+                state['parse_failures'].append({'file': html_file.name, 'error': str(e)})
+                parsed_writer.add(index, None)
+                continue
+            
+            print(f"   ✅ {html_file.name}: {form_data['title']} ({len(form_data['questions'])} questions)")
+            parsed_writer.add(index, form_data)
+            state['parsed_count'] += 1
+            state['total_questions'] += len(form_data['questions'])
+            
+            # Pre-flight validation - invalid forms never reach the API
+            errors = validator.validate_form(form_data)
+            validator.add_to_report(state['validation_report'], form_data, errors, html_file.name,
+                                    validator.form_warnings(form_data))
+            if errors:
+                print(f"   ❌ {html_file.name}: {len(errors)} validation error(s), skipping upload")
+                continue
+            
+            # Waits while the creators are behind (backpressure)
+            await forms.put((index, form_data))
+    
+    async def upload_worker(creator):
+        while True:
+            item = await forms.get()
+            if item is done:
+                return
+            index, form_data = item
+            result = await creator.create_form_result(form_data)
+            if 'form_id' in result:
+                state['created_forms'].append((index, result))
+            else:
+                state['create_failures'].append(result)
+    
+    try:
+        async with AsyncGoogleFormCreator(credentials_file) as creator:
+            uploaders = [asyncio.ensure_future(upload_worker(creator)) for _ in range(max(1, concurrency))]
+            try:
+                await asyncio.gather(*(parse_worker() for _ in range(max(1, parse_workers))))
+                for _ in uploaders:
+                    await forms.put(done)
+                await asyncio.gather(*uploaders)
+            finally:
+                for task in uploaders:
+                    task.cancel()
+    finally:
+        parsed_writer.close()
+    
+    if validation_output:
+        with open(validation_output, 'w', encoding='utf-8') as f:
+            json.dump(state['validation_report'], f, ensure_ascii=False, indent=2)
+    
+    orphaned = [failure for failure in state['create_failures'] if 'orphaned_form_id' in failure]
+    if orphaned:
+        print(f"\n⚠️  {len(orphaned)} empty forms were left behind - delete them manually:")
+        for failure in orphaned:
+            print(f"   - {failure['title']}: {failure['edit_url']}")
+    
+    # Keep the original file order in the results
+    state['created_forms'] = [form for _, form in sorted(state['created_forms'], key=lambda f: f[0])]
+    return state
+
+def main(argv: Optional[List[str]] = None):
     """Ultimate main function"""
+    arg_parser = argparse.ArgumentParser(description='Convert HTML forms to Google Forms')
+    arg_parser.add_argument('--forms-dir', default='old-forms', help='directory with HTML forms')
+    arg_parser.add_argument('--strategy', choices=UltimateRequestPlanner.STRATEGIES, default='pipeline',
+                            help='creation strategy (default: pipeline)')
+    arg_parser.add_argument('--upload-workers', type=int, default=2, help='pipeline upload threads')
+    arg_parser.add_argument('--concurrency', type=int, default=10, help='async forms in flight')
+    arg_parser.add_argument('--plan', action='store_true',
+                            help='dry run: report the API request plan without calling the API')
+    arg_parser.add_argument('--latency', type=float, default=0.5,
+                            help='assumed seconds per API call for --plan')
+    arg_parser.add_argument('--plan-output', default='request_plan_ultimate.json',
+                            help='plan JSON file for --plan')
+    args = arg_parser.parse_args(argv)
+    
     print("🌾 ULTIMATE HTML to Google Forms Converter")
     print("=" * 50)
     print("✅ PERFECT: Question ordering (১, ২, ৩...)")
@@ -521,8 +1578,8 @@ def main():
     print("✅ PERFECT: Bengali text support")
     print()
     
-    # Parse forms
-    forms_dir = Path("old-forms")
+    # Find forms
+    forms_dir = Path(args.forms_dir)
     if not forms_dir.exists():
         print(f"❌ Error: Directory '{forms_dir}' not found!")
         return
@@ -536,43 +1593,36 @@ def main():
     for i, file in enumerate(html_files, 1):
         print(f"   {i}. {file.name}")
     
-    # Parse with ultimate parser
-    print(f"\n🔍 Parsing HTML forms with ULTIMATE logic...")
-    parser = UltimateHTMLFormParser()
-    parsed_forms = []
-    
-    for html_file in html_files:
-        try:
-            form_data = parser.parse_html_file(str(html_file))
-            parsed_forms.append(form_data)
-            print(f"   ✅ {html_file.name}: {form_data['title']} ({len(form_data['questions'])} questions)")
-        except Exception as e:
-            print(f"   ❌ {html_file.name}: Error - {e}")
+    # Dry run - parse, validate and plan without any API call
+    if args.plan:
+        print(f"\n🔍 Parsing HTML forms for the request plan...")
+        parsed = parse_forms(html_files, UltimateFormValidator())
+        planner = UltimateRequestPlanner(args.strategy, args.upload_workers,
+                                         args.concurrency, args.latency)
+        plan = planner.plan(parsed['forms'])
+        plan['skipped_forms'] = parsed['validation_report']['invalid_forms'] + len(parsed['parse_failures'])
+        
+        with open(args.plan_output, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, ensure_ascii=False, indent=2)
+        
+        print(f"\n📐 ULTIMATE Request Plan ({plan['strategy']}):")
+        print(f"   📋 Forms: {plan['forms']} ({plan['questions']} questions, {plan['skipped_forms']} skipped)")
+        for method, entry in plan['calls'].items():
+            print(f"   📡 {method}: {entry['calls']} calls, {entry['bytes']} bytes (max {entry['max_bytes']})")
+        print(f"   ⏱️  Quota windows: {plan['quota']['windows']} x {plan['assumptions']['write_requests_per_minute']} writes/min")
+        print(f"   ⏳ Estimated time: {plan['estimated_seconds']['total']:.0f} seconds")
+        for warning in plan['warnings']:
+            print(f"   ⚠️  {warning}")
+        print(f"   💾 Plan saved to: {args.plan_output}")
+        return
     
-    if not parsed_forms:
-        print("❌ No forms could be parsed!")
+    # The async strategy needs aiohttp - fail before parsing anything
+    if args.strategy == 'async' and aiohttp is None:
+        print("❌ aiohttp is required for --strategy async (pip install aiohttp)")
         return
     
-    # Save data
-    with open('parsed_forms_ultimate.json', 'w', encoding='utf-8') as f:
-        json.dump(parsed_forms, f, ensure_ascii=False, indent=2)
-    
-    total_questions = sum(len(form['questions']) for form in parsed_forms)
-    print(f"\n📊 ULTIMATE Parsing Summary:")
-    print(f"   ✅ Successfully parsed: {len(parsed_forms)} forms")
-    print(f"   📋 Total questions: {total_questions}")
-    print(f"   💾 Data saved to: parsed_forms_ultimate.json")
-    
-    # Show question breakdown
-    for form in parsed_forms:
-        print(f"\n   📝 {form['title']}: {len(form['questions'])} questions")
-        for i, q in enumerate(form['questions'], 1):
-            q_type = q['type']
-            has_other = ' (+Other)' if q.get('has_other') else ''
-            print(f"      {i}. {q['question_text'][:60]}... [{q_type}{has_other}]")
-    
-    # Confirm
-    print(f"\n🚀 Ready to create ULTIMATE Google Forms!")
+    # Confirm - parsing and uploading run together, so ask up front
+    print(f"\n🚀 Ready to parse and create ULTIMATE Google Forms!")
     response = input("Do you want to proceed? (y/n): ").lower().strip()
     
     if response != 'y':
@@ -585,44 +1635,38 @@ def main():
         print(f"❌ Credentials file '{credentials_file}' not found!")
         return
     
-    # Create forms
+    # Parse and create forms
     try:
-        print(f"\n🔑 Initializing Google Forms API...")
-        creator = UltimateGoogleFormCreator(credentials_file)
+        if args.strategy == 'async':
+            print(f"\n🔍 Parsing and creating forms on one event loop...")
+            result = asyncio.run(create_forms_async(credentials_file, html_files, args.concurrency))
+        else:
+            print(f"\n🔑 Initializing Google Forms API...")
+            pipeline = UltimateFormPipeline(credentials_file, upload_workers=args.upload_workers)
+            
+            print(f"\n🔍 Parsing and creating forms with ULTIMATE pipeline...")
+            result = pipeline.run(html_files)
         
-        if not creator.service:
-            print("❌ Failed to initialize Google Forms API")
-            return
+        print(f"\n📊 ULTIMATE Parsing Summary:")
+        print(f"   ✅ Successfully parsed: {result['parsed_count']} forms")
+        print(f"   📋 Total questions: {result['total_questions']}")
+        print(f"   💾 Data saved to: parsed_forms_ultimate.json")
         
-        print("✅ Google Forms API initialized successfully")
+        validation = result['validation_report']
+        if validation['valid']:
+            print(f"   ✅ Pre-flight validation passed")
+        else:
+            print(f"   ❌ Pre-flight validation: {validation['invalid_forms']} forms rejected "
+                  f"({validation['error_count']} errors)")
+        if validation['warning_count']:
+            print(f"   ⚠️  Pre-flight validation: {validation['warning_count']} warnings (not blocking)")
+        print(f"   💾 Validation report saved to: validation_report_ultimate.json")
         
-        print(f"\n🏗️  Creating ULTIMATE Google Forms...")
-        created_forms = []
+        if not result['parsed_count']:
+            print("❌ No forms could be parsed!")
+            return
         
-        for i, form_data in enumerate(parsed_forms, 1):
-            try:
-                print(f"\n[{i}/{len(parsed_forms)}] Creating: {form_data['title']}")
-                
-                if i > 1:
-                    print("⏳ Waiting 3 seconds to avoid rate limits...")
-                    time.sleep(3)
-                
-                form_id = creator.create_form(form_data)
-                
-                created_form = {
-                    'title': form_data['title'],
-                    'form_id': form_id,
-                    'edit_url': f"https://docs.google.com/forms/d/{form_id}/edit",
-                    'response_url': f"https://docs.google.com/forms/d/{form_id}/viewform",
-                    'questions_count': len(form_data['questions'])
-                }
-                
-                created_forms.append(created_form)
-                print(f"🎉 Successfully created: {form_data['title']}")
-                
-            except Exception as e:
-                print(f"❌ Error creating form '{form_data['title']}': {e}")
-                continue
+        created_forms = result['created_forms']
         
         # Save results
         if created_forms:
@@ -641,7 +1685,7 @@ def main():
                 print(f"   🔗 Share: {form['response_url']}")
             
             print(f"\n💾 All form details saved to 'created_google_forms_ultimate.json'")
-            print(f"\n🎯 Perfect Success: Created {len(created_forms)}/{len(parsed_forms)} forms!")
+            print(f"\n🎯 Perfect Success: Created {len(created_forms)}/{result['parsed_count']} forms!")
             print(f"\nNote: Question text automatically appears bold in Google Forms interface")
         else:
             print("❌ No forms were created successfully")
@@ -650,4 +1694,4 @@ def main():
         print(f"❌ Error during form creation: {e}")
 
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file